@@ -13,12 +13,62 @@
 #  permissions and limitations under the License.
 
 
+import importlib
+from typing import Any, Dict, List, Optional
+
 import click
 
 from zenml import __version__
 from zenml.logger import set_root_verbosity
 
 
+class LazyGroup(click.Group):
+    """A click group that only imports its subcommand modules on dispatch.
+
+    Subcommands listed in `lazy_subcommands` map a command name to the
+    import path of the `click.Command` object implementing it (e.g.
+    `zenml.cli.integration_install.install`). The module is imported the
+    first time the command is dispatched or its help is rendered, so
+    `--help` on the group stays cheap.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List the names of all subcommands, including lazy ones."""
+        return sorted(
+            super().list_commands(ctx) + list(self.lazy_subcommands)
+        )
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        """Get a subcommand, importing its module if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        """Import the module of a lazy subcommand and return the command."""
+        import_path = self.lazy_subcommands[cmd_name]
+        module_name, command_name = import_path.rsplit(".", maxsplit=1)
+        module = importlib.import_module(module_name)
+        command = getattr(module, command_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of command `{cmd_name}` failed: object "
+                f"`{import_path}` is not a click command."
+            )
+        return command
+
+
 @click.group()
 @click.version_option(__version__, "--version", "-v")
 def cli() -> None:
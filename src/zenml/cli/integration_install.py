@@ -0,0 +1,128 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+
+#       https://www.apache.org/licenses/LICENSE-2.0
+
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Implementation of `zenml integration install`.
+
+This module is only imported when the command is actually dispatched (see
+the lazy subcommand registration in `zenml.cli.integration`), keeping
+`zenml integration --help` cheap.
+"""
+
+from typing import List, Tuple
+
+import click
+
+from zenml.cli.utils import (
+    confirmation,
+    declare,
+    error,
+    install_packages,
+    warning,
+)
+from zenml.console import console
+from zenml.utils.analytics_utils import AnalyticsEvent, track_event
+
+
+@click.command(
+    help="Install the required packages for the integration of choice."
+)
+@click.argument("integrations", nargs=-1, required=False)
+@click.option(
+    "--ignore-integration",
+    "-i",
+    multiple=True,
+    help="List of integrations to ignore explicitly.",
+)
+@click.option(
+    "--force",
+    "-f",
+    is_flag=True,
+    help="Force the installation of the required packages. This will skip the "
+    "confirmation step and reinstall existing packages as well",
+)
+def install(
+    integrations: Tuple[str],
+    ignore_integration: Tuple[str],
+    force: bool = False,
+) -> None:
+    """Installs the required packages for a given integration. If no integration
+    is specified all required packages for all integrations are installed
+    using pip"""
+    from zenml.integrations.registry import integration_registry
+
+    if not integrations:
+        # no integrations specified, use all registered integrations.
+        # Enumerate the registry only once; the property does work on
+        # every access.
+        all_integrations = list(integration_registry.integrations.keys())
+        selected_integrations = set(all_integrations)
+        for i in ignore_integration:
+            try:
+                selected_integrations.remove(i)
+            except KeyError:
+                error(
+                    f"Integration {i} does not exist. Available integrations: "
+                    f"{all_integrations}"
+                )
+        integrations = tuple(selected_integrations)
+
+    requirements: List[str] = []
+    integrations_to_install = []
+    # check the environment once for all integrations instead of once per
+    # integration; with --force everything is reinstalled anyway
+    installed = (
+        frozenset() if force else integration_registry.installed_set()
+    )
+    for integration_name in integrations:
+        try:
+            if force or integration_name not in installed:
+                requirements += (
+                    integration_registry.select_integration_requirements(
+                        integration_name
+                    )
+                )
+                integrations_to_install.append(integration_name)
+            else:
+                declare(
+                    f"All required packages for integration "
+                    f"'{integration_name}' are already installed."
+                )
+        except KeyError:
+            warning(f"Unable to find integration '{integration_name}'.")
+
+    # integrations often share dependencies; deduplicate so pip only has to
+    # resolve each requirement once
+    requirements = sorted(set(requirements))
+
+    if requirements and (
+        force
+        or confirmation(
+            "Are you sure you want to install the following "
+            "packages to the current environment?\n"
+            f"{requirements}"
+        )
+    ):
+        with console.status("Installing integrations..."):
+            install_packages(requirements)
+
+        # the environment changed, so cached installation checks are stale
+        from zenml.integrations.integration import clear_install_cache
+
+        clear_install_cache()
+        integration_registry.is_installed.cache_clear()
+
+        for integration_name in integrations_to_install:
+            track_event(
+                AnalyticsEvent.INSTALL_INTEGRATION,
+                {"integration_name": integration_name},
+            )
@@ -0,0 +1,87 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+
+#       https://www.apache.org/licenses/LICENSE-2.0
+
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Implementation of `zenml integration uninstall`.
+
+This module is only imported when the command is actually dispatched (see
+the lazy subcommand registration in `zenml.cli.integration`), keeping
+`zenml integration --help` cheap.
+"""
+
+from typing import List, Tuple
+
+import click
+
+from zenml.cli.utils import confirmation, uninstall_packages, warning
+from zenml.console import console
+
+
+@click.command(
+    help="Uninstall the required packages for the integration of choice."
+)
+@click.argument("integrations", nargs=-1, required=False)
+@click.option(
+    "--force",
+    "-f",
+    is_flag=True,
+    help="Force the uninstallation of the required packages. This will skip "
+    "the confirmation step",
+)
+def uninstall(integrations: Tuple[str], force: bool = False) -> None:
+    """Installs the required packages for a given integration. If no integration
+    is specified all required packages for all integrations are installed
+    using pip"""
+    from zenml.integrations.registry import integration_registry
+
+    if not integrations:
+        # no integrations specified, use all registered integrations; bind
+        # the property once, every access goes through the registry
+        integrations = tuple(integration_registry.integrations.keys())
+
+    requirements: List[str] = []
+    for integration_name in integrations:
+        try:
+            if integration_registry.is_installed(integration_name):
+                requirements += (
+                    integration_registry.select_integration_requirements(
+                        integration_name
+                    )
+                )
+            else:
+                warning(
+                    f"Requirements for integration '{integration_name}' "
+                    f"already not installed."
+                )
+        except KeyError:
+            warning(f"Unable to find integration '{integration_name}'.")
+
+    # integrations often share dependencies; deduplicate so pip only has to
+    # resolve each requirement once
+    requirements = sorted(set(requirements))
+
+    if requirements and (
+        force
+        or confirmation(
+            "Are you sure you want to uninstall the following "
+            "packages from the current environment?\n"
+            f"{requirements}"
+        )
+    ):
+        with console.status("Uninstalling integrations..."):
+            uninstall_packages(requirements)
+
+        # the environment changed, so cached installation checks are stale
+        from zenml.integrations.integration import clear_install_cache
+
+        clear_install_cache()
+        integration_registry.is_installed.cache_clear()
@@ -31,6 +31,13 @@ from zenml.stack import Stack
 @cli.group()
 def stack() -> None:
     """Stacks to define various environments."""
+    from zenml.stack.stack_component_class_registry import (
+        StackComponentClassRegistry,
+    )
+
+    # start activating the integrations in the background so that component
+    # class lookups triggered by the subcommand don't pay for it serially
+    StackComponentClassRegistry.warm_up()
 
 
 @stack.command("register", context_settings=dict(ignore_unknown_options=True))
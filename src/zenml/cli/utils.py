@@ -344,8 +344,8 @@ def install_packages(packages: List[str]) -> None:
     subprocess.check_call(command)
 
 
-def uninstall_package(package: str) -> None:
-    """Uninstalls pypi package from the current environment with pip"""
+def uninstall_packages(packages: List[str]) -> None:
+    """Uninstalls pypi packages from the current environment with pip"""
     subprocess.check_call(
         [
             sys.executable,
@@ -354,11 +354,16 @@ def uninstall_package(package: str) -> None:
             "uninstall",
             "-qqq",
             "-y",
-            package,
         ]
+        + packages
     )
 
 
+def uninstall_package(package: str) -> None:
+    """Uninstalls pypi package from the current environment with pip"""
+    uninstall_packages([package])
+
+
 def pretty_print_secret(
     secret: BaseSecretSchema, hide_secret: bool = True
 ) -> None:
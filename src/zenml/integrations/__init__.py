@@ -15,32 +15,59 @@
 The ZenML integrations module contains sub-modules for each integration that we
 support. This includes orchestrators like Apache Airflow, visualization tools
 like the ``facets`` library, as well as deep learning libraries like PyTorch.
+
+The integration sub-modules are imported lazily (PEP 562): accessing e.g.
+``zenml.integrations.AirflowIntegration`` only imports
+``zenml.integrations.airflow`` on first use, which keeps `import zenml`
+cheap even with many integrations available.
 """
+import importlib
+from typing import Any, List
+
+_LAZY = {
+    "AirflowIntegration": "zenml.integrations.airflow",
+    "AWSIntegration": "zenml.integrations.aws",
+    "AzureIntegration": "zenml.integrations.azure",
+    "AzureMLIntegration": "zenml.integrations.azureml",
+    "DashIntegration": "zenml.integrations.dash",
+    "EvidentlyIntegration": "zenml.integrations.evidently",
+    "FacetsIntegration": "zenml.integrations.facets",
+    "FeastIntegration": "zenml.integrations.feast",
+    "GcpIntegration": "zenml.integrations.gcp",
+    "GraphvizIntegration": "zenml.integrations.graphviz",
+    "HuggingfaceIntegration": "zenml.integrations.huggingface",
+    "KubeflowIntegration": "zenml.integrations.kubeflow",
+    "MlflowIntegration": "zenml.integrations.mlflow",
+    "NeuralProphetIntegration": "zenml.integrations.neural_prophet",
+    "PlotlyIntegration": "zenml.integrations.plotly",
+    "PytorchIntegration": "zenml.integrations.pytorch",
+    "PytorchLightningIntegration": "zenml.integrations.pytorch_lightning",
+    "S3Integration": "zenml.integrations.s3",
+    "SagemakerIntegration": "zenml.integrations.sagemaker",
+    "SeldonIntegration": "zenml.integrations.seldon",
+    "SklearnIntegration": "zenml.integrations.sklearn",
+    "TensorflowIntegration": "zenml.integrations.tensorflow",
+    "VertexIntegration": "zenml.integrations.vertex",
+    "WandbIntegration": "zenml.integrations.wandb",
+    "WhylogsIntegration": "zenml.integrations.whylogs",
+}
+
+__all__ = list(_LAZY.keys())
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the integration sub-module for `name` on first access."""
+    try:
+        module = importlib.import_module(_LAZY[name])
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
-from zenml.integrations.airflow import AirflowIntegration  # noqa
-from zenml.integrations.aws import AWSIntegration  # noqa
-from zenml.integrations.azure import AzureIntegration  # noqa
-from zenml.integrations.azureml import AzureMLIntegration  # noqa
-from zenml.integrations.dash import DashIntegration  # noqa
-from zenml.integrations.evidently import EvidentlyIntegration  # noqa
-from zenml.integrations.facets import FacetsIntegration  # noqa
-from zenml.integrations.feast import FeastIntegration  # noqa
-from zenml.integrations.gcp import GcpIntegration  # noqa
-from zenml.integrations.graphviz import GraphvizIntegration  # noqa
-from zenml.integrations.huggingface import HuggingfaceIntegration  # noqa
-from zenml.integrations.kubeflow import KubeflowIntegration  # noqa
-from zenml.integrations.mlflow import MlflowIntegration  # noqa
-from zenml.integrations.neural_prophet import NeuralProphetIntegration  # noqa
-from zenml.integrations.plotly import PlotlyIntegration  # noqa
-from zenml.integrations.pytorch import PytorchIntegration  # noqa
-from zenml.integrations.pytorch_lightning import (  # noqa
-    PytorchLightningIntegration,
-)
-from zenml.integrations.s3 import S3Integration  # noqa
-from zenml.integrations.sagemaker import SagemakerIntegration  # noqa
-from zenml.integrations.seldon import SeldonIntegration  # noqa
-from zenml.integrations.sklearn import SklearnIntegration  # noqa
-from zenml.integrations.tensorflow import TensorflowIntegration  # noqa
-from zenml.integrations.vertex import VertexIntegration  # noqa
-from zenml.integrations.wandb import WandbIntegration  # noqa
-from zenml.integrations.whylogs import WhylogsIntegration  # noqa
+def __dir__() -> List[str]:
+    """Includes the lazily imported integration classes."""
+    return sorted(set(globals()) | set(_LAZY))
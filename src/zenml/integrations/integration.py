@@ -11,8 +11,13 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import hashlib
+import json
+import os
+import platform
 import shutil
-from typing import Any, Dict, List, Tuple, Type, cast
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
 import pkg_resources
 
@@ -21,6 +26,120 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+_INSTALL_CACHE_FILE_NAME = "install_cache.json"
+_install_cache: Optional[Dict[str, bool]] = None
+_all_distributions: Optional[Dict[str, pkg_resources.Distribution]] = None
+
+
+def _get_distributions() -> Dict[str, pkg_resources.Distribution]:
+    """Get a snapshot of the installed distributions, keyed by project name.
+
+    The snapshot is built once per process and shared by all `Integration`
+    subclasses, so checking N requirements across M integrations costs one
+    environment enumeration plus N dict lookups instead of N·M metadata
+    resolutions.
+    """
+    global _all_distributions
+    if _all_distributions is None:
+        _all_distributions = {
+            distribution.key: distribution
+            for distribution in pkg_resources.working_set
+        }
+    return _all_distributions
+
+
+def _install_cache_path() -> str:
+    """Path of the on-disk cache of validated integration requirements."""
+    from zenml.io.utils import get_global_config_directory
+
+    return os.path.join(get_global_config_directory(), _INSTALL_CACHE_FILE_NAME)
+
+
+def _environment_fingerprint() -> str:
+    """Fingerprint of the Python package environment.
+
+    Derived from the interpreter version and the modification times of the
+    site-packages directories on `sys.path`; (un)installing any package
+    updates those directories and therefore invalidates cached installation
+    checks from older environments.
+    """
+    entries = [platform.python_version()]
+    for path in sorted(set(sys.path)):
+        if not path.endswith(("site-packages", "dist-packages")):
+            continue
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        entries.append(f"{path}:{mtime}")
+    digest = hashlib.blake2b("\n".join(entries).encode(), digest_size=16)
+    return digest.hexdigest()
+
+
+def _get_install_cache() -> Dict[str, bool]:
+    """Load the on-disk cache of validated integration requirements.
+
+    The cache maps `<python version>:<requirement>` keys to `True` for
+    requirements that were found to be installed in a previous process, so
+    repeated `check_installation` calls across processes don't block on
+    package metadata resolution for already-validated environments. Only
+    positive results are cached: missing or conflicting requirements are
+    re-checked every time, so installing a package takes effect immediately.
+    Cached results are only trusted if the environment fingerprint recorded
+    alongside them still matches, so package changes made by other
+    processes invalidate the cache as well.
+    """
+    global _install_cache
+    if _install_cache is not None:
+        return _install_cache
+    cache: Dict[str, bool] = {}
+    try:
+        with open(_install_cache_path()) as f:
+            contents = json.load(f)
+    except (OSError, ValueError):
+        contents = None
+    if (
+        isinstance(contents, dict)
+        and contents.get("fingerprint") == _environment_fingerprint()
+        and isinstance(contents.get("requirements"), dict)
+    ):
+        cache = contents["requirements"]
+    _install_cache = cache
+    return cache
+
+
+def _persist_install_cache() -> None:
+    """Write the cache of validated integration requirements to disk."""
+    try:
+        path = _install_cache_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "fingerprint": _environment_fingerprint(),
+                    "requirements": _get_install_cache(),
+                },
+                f,
+            )
+    except OSError as e:
+        logger.debug("Unable to persist the installation cache: %s", str(e))
+
+
+def clear_install_cache() -> None:
+    """Reset and delete the cached integration requirement checks.
+
+    Must be called after packages are installed or uninstalled at runtime,
+    so that subsequent installation checks don't trust results gathered
+    from the previous environment.
+    """
+    global _install_cache, _all_distributions
+    _install_cache = {}
+    _all_distributions = None
+    try:
+        os.remove(_install_cache_path())
+    except OSError:
+        pass
+
 
 class IntegrationMeta(type):
     """Metaclass responsible for registering different Integration
@@ -61,8 +180,33 @@ class Integration(metaclass=IntegrationMeta):
                     )
                     return False
 
+            cache = _get_install_cache()
+            python_version = platform.python_version()
+            cache_updated = False
+            distributions: Optional[
+                Dict[str, pkg_resources.Distribution]
+            ] = None
             for r in cls.REQUIREMENTS:
-                pkg_resources.get_distribution(r)
+                cache_key = f"{python_version}:{r}"
+                if cache.get(cache_key):
+                    # already validated in a previous process
+                    continue
+                if distributions is None:
+                    distributions = _get_distributions()
+                parsed_requirement = pkg_resources.Requirement.parse(r)
+                distribution = distributions.get(parsed_requirement.key)
+                if distribution is None:
+                    raise pkg_resources.DistributionNotFound(
+                        parsed_requirement, None
+                    )
+                if distribution not in parsed_requirement:
+                    raise pkg_resources.VersionConflict(
+                        distribution, parsed_requirement
+                    )
+                cache[cache_key] = True
+                cache_updated = True
+            if cache_updated:
+                _persist_install_cache()
             logger.debug(
                 f"Integration {cls.NAME} is installed correctly with "
                 f"requirements {cls.REQUIREMENTS}."
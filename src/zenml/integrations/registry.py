@@ -12,7 +12,11 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+import shutil
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Type
+
+import pkg_resources
 
 from zenml.exceptions import IntegrationError
 from zenml.logger import get_logger
@@ -29,6 +33,23 @@ class IntegrationRegistry(object):
     def __init__(self) -> None:
         """Initializing the integration registry"""
         self._integrations: Dict[str, Type["Integration"]] = {}
+        self._integrations_loaded = False
+
+    def _load_integrations(self) -> None:
+        """Imports all integration sub-modules so their `Integration`
+        subclasses register themselves.
+
+        The `zenml.integrations` package imports its sub-modules lazily
+        (PEP 562), so the registry triggers those imports on first access
+        instead of paying for all of them at import time."""
+        if self._integrations_loaded:
+            return
+        self._integrations_loaded = True
+
+        import zenml.integrations as integrations_module
+
+        for name in integrations_module.__all__:
+            getattr(integrations_module, name)
 
     @property
     def integrations(self) -> Dict[str, Type["Integration"]]:
@@ -37,6 +58,7 @@ class IntegrationRegistry(object):
         Returns:
             A dict of integration key to type of `Integration`.
         """
+        self._load_integrations()
         return self._integrations
 
     @integrations.setter
@@ -58,7 +80,7 @@ class IntegrationRegistry(object):
     def activate_integrations(self) -> None:
         """Method to activate the integrations with are registered in the
         registry"""
-        for name, integration in self._integrations.items():
+        for name, integration in self.integrations.items():
             if integration.check_installation():
                 integration.activate()
                 logger.debug(f"Integration `{name}` is activated.")
@@ -68,13 +90,17 @@ class IntegrationRegistry(object):
     @property
     def list_integration_names(self) -> List[str]:
         """Get a list of all possible integrations"""
-        return [name for name in self._integrations]
+        return [name for name in self.integrations]
 
+    @lru_cache(maxsize=None)
     def select_integration_requirements(
         self, integration_name: Optional[str] = None
     ) -> List[str]:
         """Select the requirements for a given integration
-        or all integrations"""
+        or all integrations.
+
+        The result is memoized per integration name since requirement lists
+        are static for the lifetime of the process."""
         if integration_name:
             if integration_name in self.list_integration_names:
                 return self._integrations[integration_name].REQUIREMENTS
@@ -91,8 +117,42 @@ class IntegrationRegistry(object):
                 for requirement in self._integrations[name].REQUIREMENTS
             ]
 
+    def installed_set(self) -> FrozenSet[str]:
+        """Get the names of all integrations whose requirements are installed.
+
+        This is a bulk variant of `is_installed`: the installed
+        distributions are enumerated only once and every integration's
+        requirements are checked against that snapshot, instead of querying
+        the environment once per requirement per integration."""
+        installed_distributions = {
+            distribution.key: distribution
+            for distribution in pkg_resources.working_set
+        }
+
+        def _requirements_installed(integration: Type["Integration"]) -> bool:
+            for command in integration.SYSTEM_REQUIREMENTS.values():
+                if shutil.which(command) is None:
+                    return False
+            for requirement in integration.REQUIREMENTS:
+                parsed = pkg_resources.Requirement.parse(requirement)
+                distribution = installed_distributions.get(parsed.key)
+                if distribution is None or distribution not in parsed:
+                    return False
+            return True
+
+        return frozenset(
+            name
+            for name, integration in self.integrations.items()
+            if _requirements_installed(integration)
+        )
+
+    @lru_cache(maxsize=None)
     def is_installed(self, integration_name: Optional[str] = None) -> bool:
-        """Checks if all requirements for an integration are installed"""
+        """Checks if all requirements for an integration are installed.
+
+        The result is memoized per integration name; callers that change the
+        environment (e.g. by installing packages) should invalidate it with
+        `is_installed.cache_clear()`."""
         if integration_name in self.list_integration_names:
             return self._integrations[integration_name].check_installation()
         elif not integration_name:
@@ -12,12 +12,18 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-from datetime import datetime
-from typing import ClassVar, Dict, List, Optional, cast
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Set, Tuple, cast
 from uuid import UUID
 
 from zenml.integrations.constants import SELDON
-from zenml.integrations.seldon.seldon_client import SeldonClient
+from zenml.integrations.seldon.seldon_client import (
+    SeldonClient,
+    SeldonDeployment,
+)
 from zenml.integrations.seldon.services.seldon_deployment import (
     SeldonDeploymentConfig,
     SeldonDeploymentService,
@@ -33,6 +39,37 @@ from zenml.stack.stack_component_class_registry import (
 logger = get_logger(__name__)
 
 DEFAULT_SELDON_DEPLOYMENT_START_STOP_TIMEOUT = 300
+DEFAULT_SELDON_DEPLOYMENT_LOOKUP_TTL = 2.0
+
+
+@lru_cache(maxsize=256)
+def _seldon_deployment_labels(
+    pipeline_name: str,
+    pipeline_run_id: str,
+    pipeline_step_name: str,
+    model_name: str,
+    model_uri: str,
+    model_type: str,
+) -> FrozenSet[Tuple[str, str]]:
+    """Compute the Seldon Core deployment labels for a lookup query.
+
+    Callers (e.g. reconciliation loops) tend to poll `find_model_server`
+    repeatedly with the same search criteria, so the label computation is
+    memoized here instead of rebuilding a `SeldonDeploymentConfig` on every
+    call. The result is a frozenset so that it is hashable and immutable.
+
+    Returns:
+        The labels for the Seldon Core deployment as frozen key-value pairs.
+    """
+    config = SeldonDeploymentConfig(
+        pipeline_name=pipeline_name,
+        pipeline_run_id=pipeline_run_id,
+        pipeline_step_name=pipeline_step_name,
+        model_name=model_name,
+        model_uri=model_uri,
+        implementation=model_type,
+    )
+    return frozenset(config.get_seldon_deployment_labels().items())
 
 
 @register_stack_component_class
@@ -65,6 +102,14 @@ class SeldonModelDeployer(BaseModelDeployer):
 
     # private attributes
     _client: Optional[SeldonClient] = None
+    # stale-while-revalidate cache for Kubernetes deployment lookups, shared
+    # by all deployer instances and keyed by the label selector
+    _deployment_cache: ClassVar[
+        Dict[FrozenSet[Tuple[str, str]], Tuple[float, List[SeldonDeployment]]]
+    ] = {}
+    _deployment_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    _deployment_refreshes: ClassVar[Set[FrozenSet[Tuple[str, str]]]] = set()
+    _deployment_cache_generation: ClassVar[int] = 0
 
     @staticmethod
     def get_model_server_info(  # type: ignore[override]
@@ -130,6 +175,93 @@ class SeldonModelDeployer(BaseModelDeployer):
             )
         return self._client
 
+    def _find_deployments(
+        self, labels: Dict[str, str]
+    ) -> List[SeldonDeployment]:
+        """Find the Seldon Core deployments that match the given labels,
+        caching results for a short time.
+
+        Busy reconcilers poll `find_model_server` with the same label
+        selector over and over, turning every poll into a Kubernetes API
+        round-trip. This method keeps a short-TTL cache in front of
+        `SeldonClient.find_deployments`: results within the TTL are served
+        directly, stale results are served immediately while a background
+        thread refreshes them (stale-while-revalidate).
+
+        Args:
+            labels: the labels to match the Seldon Core deployments against.
+
+        Returns:
+            The list of Seldon Core deployments matching the labels.
+        """
+        key = frozenset(labels.items())
+        entry = self._deployment_cache.get(key)
+        if entry is not None:
+            timestamp, deployments = entry
+            if time.monotonic() - timestamp >= (
+                DEFAULT_SELDON_DEPLOYMENT_LOOKUP_TTL
+            ):
+                # serve the stale result and refresh it in the background
+                self._refresh_deployments(key, labels)
+            return deployments
+
+        deployments = self.seldon_client.find_deployments(labels=labels)
+        self._deployment_cache[key] = (time.monotonic(), deployments)
+        return deployments
+
+    def _refresh_deployments(
+        self, key: FrozenSet[Tuple[str, str]], labels: Dict[str, str]
+    ) -> None:
+        """Refresh a cached Seldon Core deployment lookup in the background.
+
+        Args:
+            key: the cache key of the lookup to refresh.
+            labels: the labels to match the Seldon Core deployments against.
+        """
+        with self._deployment_cache_lock:
+            if key in self._deployment_refreshes:
+                # a refresh for this lookup is already in flight
+                return
+            self._deployment_refreshes.add(key)
+
+        generation = self._deployment_cache_generation
+
+        def _refresh() -> None:
+            try:
+                deployments = self.seldon_client.find_deployments(
+                    labels=labels
+                )
+                with self._deployment_cache_lock:
+                    if generation == self._deployment_cache_generation:
+                        # only store the result if the cache wasn't
+                        # invalidated by a deployment create/update/delete
+                        # while the refresh was in flight; the result may
+                        # predate that write
+                        self._deployment_cache[key] = (
+                            time.monotonic(),
+                            deployments,
+                        )
+            finally:
+                with self._deployment_cache_lock:
+                    self._deployment_refreshes.discard(key)
+
+        threading.Thread(target=_refresh, daemon=True).start()
+
+    @classmethod
+    def _invalidate_deployment_cache(cls) -> None:
+        """Drop all cached Seldon Core deployment lookups.
+
+        Must be called whenever this deployer creates, updates or deletes a
+        Seldon Core deployment: cached lookups taken before the write no
+        longer reflect the cluster state, and serving them stale would make
+        subsequent `deploy_model` or `delete_model_server` calls operate on
+        outdated deployment lists. The stale-while-revalidate behavior of
+        `_find_deployments` is only safe for pure polling reads.
+        """
+        with cls._deployment_cache_lock:
+            cls._deployment_cache.clear()
+            cls._deployment_cache_generation += 1
+
     def deploy_model(
         self,
         config: ServiceConfig,
@@ -189,6 +321,7 @@ class SeldonModelDeployer(BaseModelDeployer):
         """
         config = cast(SeldonDeploymentConfig, config)
         service = None
+        older_services: List[BaseService] = []
 
         # if replace is True, find equivalent Seldon Core deployments
         if replace is True:
@@ -199,33 +332,54 @@ class SeldonModelDeployer(BaseModelDeployer):
                 model_name=config.model_name,
             )
 
-            for equivalent_service in equivalent_services:
-                if service is None:
-                    # keep the most recently created service
-                    service = equivalent_service
-                else:
+            if equivalent_services:
+                # keep the most recently created service
+                service = equivalent_services[0]
+
+            older_services = equivalent_services[1:]
+
+        try:
+            if older_services:
+
+                def _stop_service(old_service: BaseService) -> None:
                     try:
-                        # delete the older services and don't wait for them to
-                        # be deprovisioned
-                        service.stop()
+                        # delete the older services and don't wait for them
+                        # to be deprovisioned
+                        old_service.stop()
                     except RuntimeError:
-                        # ignore errors encountered while stopping old services
+                        # ignore errors encountered while stopping old
+                        # services
                         pass
 
-        if service:
-            # update an equivalent service in place
-            service.update(config)
-            logger.info(
-                f"Updating an existing Seldon deployment service: {service}"
-            )
-        else:
-            # create a new service
-            service = SeldonDeploymentService(config=config)
-            logger.info(f"Creating a new Seldon deployment service: {service}")
-
-        # start the service which in turn provisions the Seldon Core
-        # deployment server and waits for it to reach a ready state
-        service.start(timeout=timeout)
+                # the stop calls are independent, I/O bound Kubernetes
+                # requests, so issue them concurrently instead of serially
+                with ThreadPoolExecutor(
+                    max_workers=min(8, len(older_services))
+                ) as executor:
+                    list(executor.map(_stop_service, older_services))
+
+            if service:
+                # update an equivalent service in place
+                service.update(config)
+                logger.info(
+                    f"Updating an existing Seldon deployment service: "
+                    f"{service}"
+                )
+            else:
+                # create a new service
+                service = SeldonDeploymentService(config=config)
+                logger.info(
+                    f"Creating a new Seldon deployment service: {service}"
+                )
+
+            # start the service which in turn provisions the Seldon Core
+            # deployment server and waits for it to reach a ready state
+            service.start(timeout=timeout)
+        finally:
+            # deployments were created, updated or deleted above (possibly
+            # only partially, if an error occurred), so cached lookups no
+            # longer reflect the cluster state
+            self._invalidate_deployment_cache()
         return service
 
     def find_model_server(
@@ -265,45 +419,62 @@ class SeldonModelDeployer(BaseModelDeployer):
             One or more Seldon Core service objects representing Seldon Core
             model servers that match the input search criteria.
         """
-        # Use a Seldon deployment service configuration to compute the labels
-        config = SeldonDeploymentConfig(
-            pipeline_name=pipeline_name or "",
-            pipeline_run_id=pipeline_run_id or "",
-            pipeline_step_name=pipeline_step_name or "",
-            model_name=model_name or "",
-            model_uri=model_uri or "",
-            implementation=model_type or "",
-        )
-        labels = config.get_seldon_deployment_labels()
-        if service_uuid:
-            # the service UUID is not a label covered by the Seldon
-            # deployment service configuration, so we need to add it
-            # separately
-            labels["zenml.service_uuid"] = str(service_uuid)
-
-        deployments = self.seldon_client.find_deployments(labels=labels)
-        # sort the deployments in descending order of their creation time
-        deployments.sort(
-            key=lambda deployment: datetime.strptime(
-                deployment.metadata.creationTimestamp,
-                "%Y-%m-%dT%H:%M:%SZ",
+        if service_uuid and not any(
+            [
+                pipeline_name,
+                pipeline_run_id,
+                pipeline_step_name,
+                model_name,
+                model_uri,
+                model_type,
+            ]
+        ):
+            # fast path for UUID-only lookups (e.g. `delete_model_server`):
+            # all other labels would be empty and filtered out anyway, so
+            # skip the label computation entirely
+            labels = {"zenml.service_uuid": str(service_uuid)}
+        else:
+            # Use a (cached) Seldon deployment service configuration to
+            # compute the labels
+            labels = dict(
+                _seldon_deployment_labels(
+                    pipeline_name or "",
+                    pipeline_run_id or "",
+                    pipeline_step_name or "",
+                    model_name or "",
+                    model_uri or "",
+                    model_type or "",
+                )
             )
-            if deployment.metadata.creationTimestamp
-            else datetime.min,
+            if service_uuid:
+                # the service UUID is not a label covered by the Seldon
+                # deployment service configuration, so we need to add it
+                # separately
+                labels["zenml.service_uuid"] = str(service_uuid)
+
+        deployments = self._find_deployments(labels)
+        # sort the deployments in descending order of their creation time.
+        # The `creationTimestamp` values are fixed-width ISO-8601 strings
+        # (`YYYY-MM-DDTHH:MM:SSZ`), so comparing them lexicographically gives
+        # the same ordering as parsing them into `datetime` objects, without
+        # paying the `datetime.strptime` cost for every deployment.
+        deployments.sort(
+            key=lambda deployment: deployment.metadata.creationTimestamp or "",
             reverse=True,
         )
 
-        services: List[BaseService] = []
-        for deployment in deployments:
-            # recreate the Seldon deployment service object from the Seldon
-            # deployment resource
-            service = SeldonDeploymentService.create_from_deployment(
-                deployment=deployment
-            )
-            if running and not service.is_running:
-                # skip non-running services
-                continue
-            services.append(service)
+        # recreate the Seldon deployment service objects from the Seldon
+        # deployment resources, skipping non-running deployments before
+        # paying for the service construction (Pydantic validation and a
+        # status refresh against the cluster). The constructor is bound to
+        # a local so the attribute lookup isn't repeated for every
+        # deployment.
+        _create = SeldonDeploymentService.create_from_deployment
+        services: List[BaseService] = [
+            _create(deployment=deployment)
+            for deployment in deployments
+            if not running or deployment.is_available()
+        ]
 
         return services
 
@@ -361,4 +532,9 @@ class SeldonModelDeployer(BaseModelDeployer):
         services = self.find_model_server(service_uuid=uuid)
         if len(services) == 0:
             return
-        services[0].stop(timeout=timeout, force=force)
+        try:
+            services[0].stop(timeout=timeout, force=force)
+        finally:
+            # the deployment was deleted, so cached lookups that still list
+            # it must not be served
+            self._invalidate_deployment_cache()
@@ -15,6 +15,7 @@
 import json
 import re
 import time
+from datetime import datetime
 from typing import Dict, List, Optional
 
 from kubernetes import client as k8s_client
@@ -46,6 +47,24 @@ class SeldonDeploymentMetadata(BaseModel):
     annotations: Dict[str, str] = Field(default_factory=dict)
     creationTimestamp: Optional[str]
 
+    @property
+    def creation_datetime(self) -> datetime:
+        """The creation timestamp parsed into a `datetime` object.
+
+        The raw `creationTimestamp` is kept as a string so that deployments
+        can be compared and sorted without parsing; this property parses it
+        lazily with `datetime.fromisoformat`, which is considerably faster
+        than `datetime.strptime` for the fixed `YYYY-MM-DDTHH:MM:SSZ`
+        Kubernetes format. Returns `datetime.min` if the timestamp is not
+        set.
+        """
+        timestamp = self.creationTimestamp
+        if not timestamp:
+            return datetime.min
+        if timestamp.endswith("Z"):
+            timestamp = timestamp[:-1]
+        return datetime.fromisoformat(timestamp)
+
     class Config:
         """Pydantic configuration class."""
 
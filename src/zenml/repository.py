@@ -12,17 +12,31 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 import base64
-import json
 import os
 import random
 from abc import ABCMeta
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 import yaml
 from pydantic import BaseModel, ValidationError
 
+try:
+    # optional: considerably faster JSON encoding for the config sidecar
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from zenml.config.base_config import BaseConfiguration
 from zenml.config.global_config import GlobalConfiguration
 from zenml.config.profile_config import ProfileConfiguration
@@ -35,24 +49,51 @@ from zenml.exceptions import (
 )
 from zenml.io import fileio, utils
 from zenml.logger import get_logger
-from zenml.post_execution import PipelineView
-from zenml.stack import Stack, StackComponent
-from zenml.stack_stores import (
-    BaseStackStore,
-    LocalStackStore,
-    RestStackStore,
-    SqlStackStore,
-)
-from zenml.stack_stores.models import (
-    StackComponentWrapper,
-    StackStoreModel,
-    StackWrapper,
-)
 from zenml.utils import yaml_utils
 from zenml.utils.analytics_utils import AnalyticsEvent, track, track_event
 
+if TYPE_CHECKING:
+    from zenml.post_execution import PipelineView
+    from zenml.stack import Stack, StackComponent
+    from zenml.stack_stores import BaseStackStore
+    from zenml.stack_stores.models import (
+        StackComponentWrapper,
+        StackStoreModel,
+        StackWrapper,
+    )
+
 logger = get_logger(__name__)
 
+# process-level caches to avoid repeated filesystem walks and config file
+# parsing when `Repository` instances are constructed multiple times (e.g.
+# by CLI commands). The repository root cache maps the search start
+# directory to the discovered repository root and is revalidated with a
+# single stat call per lookup; the config cache is a small LRU keyed by the
+# config file path and validated against the file's mtime and size.
+_REPO_ROOT_CACHE: Dict[str, Path] = {}
+_CONFIG_CACHE_SIZE = 100
+_CONFIG_CACHE: "OrderedDict[str, Tuple[float, int, RepositoryConfiguration]]" = (
+    OrderedDict()
+)
+
+
+def _refresh_env() -> Optional[Path]:
+    """Re-resolve the `ZENML_REPOSITORY_PATH` environment variable.
+
+    The result is kept in `_ENV_REPO_PATH` so that `find_repository` does
+    not have to query the environment and allocate a new `Path` on every
+    call. Tests that modify the environment variable should call this
+    function to refresh the cached value.
+    """
+    global _ENV_REPO_PATH
+    env_var_path = os.getenv(ENV_ZENML_REPOSITORY_PATH)
+    _ENV_REPO_PATH = Path(env_var_path) if env_var_path else None
+    return _ENV_REPO_PATH
+
+
+_ENV_REPO_PATH: Optional[Path] = None
+_refresh_env()
+
 
 class RepositoryConfiguration(BaseModel):
     """Pydantic object used for serializing repository configuration options.
@@ -84,8 +125,10 @@ class LegacyRepositoryConfig(BaseModel):
     stacks: Dict[str, Dict[StackComponentType, Optional[str]]]
     stack_components: Dict[StackComponentType, Dict[str, str]]
 
-    def get_stack_data(self) -> StackStoreModel:
+    def get_stack_data(self) -> "StackStoreModel":
         """Extract stack data from Legacy Repository file."""
+        from zenml.stack_stores.models import StackStoreModel
+
         return StackStoreModel(
             stacks={
                 name: {
@@ -204,6 +247,13 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         self._root: Optional[Path] = None
         self._profile: Optional[ProfileConfiguration] = None
         self.__config: Optional[RepositoryConfiguration] = None
+        # cache of the last resolved active stack, keyed by its name;
+        # invalidated whenever stacks or components change
+        self._active_stack_cache: Optional[Tuple[str, "Stack"]] = None
+        # cache of metadata stores keyed by stack name, so repeated
+        # pipeline lookups don't rebuild the entire stack each time;
+        # invalidated together with the active stack cache
+        self._metadata_store_cache: Dict[str, Any] = {}
 
         # The repository constructor is called with a custom profile only when
         # the profile needs to be initialized, in which case all matters related
@@ -217,6 +267,17 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
 
         self._set_active_root(root)
 
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Clear the process-level repository root and configuration caches.
+
+        This method is meant for internal use and testing purposes, e.g.
+        when repositories are created and deleted programmatically within
+        the same process.
+        """
+        _REPO_ROOT_CACHE.clear()
+        _CONFIG_CACHE.clear()
+
     @classmethod
     def get_instance(cls) -> Optional["Repository"]:
         """Return the Repository singleton instance.
@@ -308,7 +369,9 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             profile: configuration profile to set as active.
         """
         self._profile = profile
-        self.stack_store: BaseStackStore = self.create_store(profile)
+        self._active_stack_cache = None
+        self._metadata_store_cache.clear()
+        self.stack_store: "BaseStackStore" = self.create_store(profile)
 
         # Sanitize the repository configuration to reflect the active
         # profile and its store contents
@@ -325,6 +388,22 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             return None
         return str(self.config_directory / "config.yaml")
 
+    def _config_json_path(self) -> Optional[str]:
+        """Path to the JSON sidecar of the repository configuration file.
+
+        The sidecar mirrors the content of `config.yaml` and is preferred
+        on load when it is at least as new, because parsing JSON is much
+        cheaper than parsing YAML. The YAML file remains the canonical,
+        hand-editable configuration.
+
+        Returns:
+            Path to the JSON sidecar file or None if the repository root
+            has not been initialized yet.
+        """
+        if not self.config_directory:
+            return None
+        return str(self.config_directory / "config.json")
+
     def _sanitize_config(self) -> None:
         """Sanitize and save the repository configuration.
 
@@ -442,6 +521,8 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         )
 
         stack_data = legacy_config.get_stack_data()
+        from zenml.stack_stores import LocalStackStore
+
         store = LocalStackStore()
         store.initialize(url=config_path, stack_data=stack_data)
         store._write_store()
@@ -455,8 +536,7 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             active_profile_name=profile.name,
             active_stack_name=legacy_config.active_stack_name,
         )
-        new_config_dict = json.loads(new_config.json())
-        yaml_utils.write_yaml(config_file, new_config_dict)
+        yaml_utils.write_yaml(config_file, new_config.dict())
         GlobalConfiguration().add_or_update_profile(profile)
 
         return profile
@@ -483,6 +563,34 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         if not config_path:
             return None
 
+        # prefer the JSON sidecar if it is at least as new as the YAML
+        # config: same content, much cheaper to parse
+        json_path = self._config_json_path()
+        if json_path:
+            try:
+                json_mtime = os.stat(json_path).st_mtime
+            except OSError:
+                json_mtime = None
+            if json_mtime is not None:
+                try:
+                    yaml_mtime: Optional[float] = os.stat(
+                        config_path
+                    ).st_mtime
+                except OSError:
+                    yaml_mtime = None
+                if yaml_mtime is None or json_mtime >= yaml_mtime:
+                    logger.debug(
+                        f"Loading repository configuration from {json_path}."
+                    )
+                    try:
+                        with open(json_path) as f:
+                            return RepositoryConfiguration.parse_raw(
+                                f.read()
+                            )
+                    except (OSError, ValueError, ValidationError):
+                        # fall back to the YAML configuration
+                        pass
+
         # load the repository configuration file if it exists, otherwise use
         # an empty configuration as default
         if fileio.exists(config_path):
@@ -490,6 +598,24 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
                 f"Loading repository configuration from {config_path}."
             )
 
+            try:
+                file_stat: Optional[os.stat_result] = os.stat(config_path)
+            except OSError:
+                file_stat = None
+
+            if file_stat:
+                cached = _CONFIG_CACHE.get(config_path)
+                if (
+                    cached
+                    and cached[0] == file_stat.st_mtime
+                    and cached[1] == file_stat.st_size
+                ):
+                    # the file hasn't changed since it was last parsed;
+                    # return a copy because the configuration object is
+                    # mutated by the repository
+                    _CONFIG_CACHE.move_to_end(config_path)
+                    return cached[2].copy(deep=True)
+
             # detect an old style repository configuration and migrate it to
             # the new format and create a profile out of it if necessary
             self._migrate_legacy_repository(config_path)
@@ -497,6 +623,16 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             config_dict = yaml_utils.read_yaml(config_path)
             config = RepositoryConfiguration.parse_obj(config_dict)
 
+            if file_stat:
+                _CONFIG_CACHE[config_path] = (
+                    file_stat.st_mtime,
+                    file_stat.st_size,
+                    config.copy(deep=True),
+                )
+                _CONFIG_CACHE.move_to_end(config_path)
+                while len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+                    _CONFIG_CACHE.popitem(last=False)
+
             return config
 
         logger.debug(
@@ -511,12 +647,38 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         config_path = self._config_path()
         if not config_path or not self.__config:
             return
-        config_dict = json.loads(self.__config.json())
-        yaml_utils.write_yaml(config_path, config_dict)
+        # `dict()` is enough here: the configuration only contains plain
+        # strings, so no JSON encode/decode round-trip is needed to make it
+        # YAML-serializable
+        yaml_utils.write_yaml(config_path, self.__config.dict())
+        # the file on disk changed, so the cached parse is stale
+        _CONFIG_CACHE.pop(config_path, None)
+
+        # keep the cheap-to-parse JSON sidecar in sync; it is written after
+        # the YAML file so its mtime is at least as new
+        json_path = self._config_json_path()
+        if json_path:
+            try:
+                if orjson is not None:
+                    with open(json_path, "wb") as fb:
+                        fb.write(orjson.dumps(self.__config.dict()))
+                else:
+                    with open(json_path, "w") as f:
+                        f.write(self.__config.json())
+            except OSError as e:
+                logger.debug(
+                    "Unable to write repository config sidecar: %s", str(e)
+                )
 
     @staticmethod
-    def get_store_class(type: StoreType) -> Optional[Type[BaseStackStore]]:
+    def get_store_class(type: StoreType) -> Optional[Type["BaseStackStore"]]:
         """Returns the class of the given store type."""
+        from zenml.stack_stores import (
+            LocalStackStore,
+            RestStackStore,
+            SqlStackStore,
+        )
+
         return {
             StoreType.LOCAL: LocalStackStore,
             StoreType.SQL: SqlStackStore,
@@ -526,7 +688,7 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
     @staticmethod
     def create_store(
         profile: ProfileConfiguration, skip_default_stack: bool = False
-    ) -> BaseStackStore:
+    ) -> "BaseStackStore":
         """Create the repository persistence back-end store from a configuration
         profile.
 
@@ -597,6 +759,9 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
 
         config_directory = str(root / REPOSITORY_DIRECTORY_NAME)
         utils.create_dir_recursive_if_not_exists(config_directory)
+        # a new repository was created on disk, so cached repository root
+        # lookups are no longer valid
+        Repository.clear_caches()
         # Initialize the repository configuration at the custom path
         Repository(root=root)
 
@@ -608,6 +773,8 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         """
 
         # register and activate a local stack
+        from zenml.stack import Stack
+
         stack = Stack.default_local_stack()
         self.register_stack(stack)
         self.activate_stack(stack.name)
@@ -705,7 +872,7 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         return self.active_profile.name
 
     @property
-    def stacks(self) -> List[Stack]:
+    def stacks(self) -> List["Stack"]:
         """All stacks registered in this repository."""
         return [self._stack_from_wrapper(s) for s in self.stack_store.stacks]
 
@@ -726,7 +893,7 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         return self.stack_store.stack_configurations
 
     @property
-    def active_stack(self) -> Stack:
+    def active_stack(self) -> "Stack":
         """The active stack for this repository.
 
         Raises:
@@ -734,7 +901,15 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             KeyError: If no stack was found for the configured name or one
                 of the stack components is not registered.
         """
-        return self.get_stack(name=self.active_stack_name)
+        name = self.active_stack_name
+        if self._active_stack_cache and self._active_stack_cache[0] == name:
+            # re-use the previously resolved stack instead of re-validating
+            # all its components on every access
+            return self._active_stack_cache[1]
+
+        stack = self.get_stack(name=name)
+        self._active_stack_cache = (name, stack)
+        return stack
 
     @property
     def active_stack_name(self) -> str:
@@ -774,6 +949,8 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             KeyError: If no stack exists for the given name.
         """
         self.stack_store.get_stack_configuration(name)  # raises KeyError
+        self._active_stack_cache = None
+        self._metadata_store_cache.clear()
         if self.__config:
             self.__config.active_stack_name = name
             self._write_config()
@@ -784,7 +961,7 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         if not self.root or not self.active_profile.active_stack:
             self.active_profile.activate_stack(name)
 
-    def get_stack(self, name: str) -> Stack:
+    def get_stack(self, name: str) -> "Stack":
         """Fetches a stack.
 
         Args:
@@ -796,7 +973,7 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         """
         return self._stack_from_wrapper(self.stack_store.get_stack(name))
 
-    def register_stack(self, stack: Stack) -> None:
+    def register_stack(self, stack: "Stack") -> None:
         """Registers a stack and it's components.
 
         If any of the stacks' components aren't registered in the repository
@@ -811,6 +988,10 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
                 registered and a different component with the same name
                 already exists.
         """
+        from zenml.stack_stores.models import StackWrapper
+
+        self._active_stack_cache = None
+        self._metadata_store_cache.clear()
         metadata = self.stack_store.register_stack(
             StackWrapper.from_stack(stack)
         )
@@ -829,6 +1010,8 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         """
         if name == self.active_stack_name:
             raise ValueError(f"Unable to deregister active stack '{name}'.")
+        self._active_stack_cache = None
+        self._metadata_store_cache.clear()
         try:
             self.stack_store.deregister_stack(name)
             logger.info("Deregistered stack with name '%s'.", name)
@@ -841,7 +1024,7 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
 
     def get_stack_components(
         self, component_type: StackComponentType
-    ) -> List[StackComponent]:
+    ) -> List["StackComponent"]:
         """Fetches all registered stack components of the given type."""
         return [
             self._component_from_wrapper(c)
@@ -850,7 +1033,7 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
 
     def get_stack_component(
         self, component_type: StackComponentType, name: str
-    ) -> StackComponent:
+    ) -> "StackComponent":
         """Fetches a registered stack component.
 
         Args:
@@ -871,7 +1054,7 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
 
     def register_stack_component(
         self,
-        component: StackComponent,
+        component: "StackComponent",
     ) -> None:
         """Registers a stack component.
 
@@ -882,6 +1065,10 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             StackComponentExistsError: If a stack component with the same type
                 and name already exists.
         """
+        from zenml.stack_stores.models import StackComponentWrapper
+
+        self._active_stack_cache = None
+        self._metadata_store_cache.clear()
         self.stack_store.register_stack_component(
             StackComponentWrapper.from_component(component)
         )
@@ -903,6 +1090,8 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             component_type: The type of the component to deregister.
             name: The name of the component to deregister.
         """
+        self._active_stack_cache = None
+        self._metadata_store_cache.clear()
         try:
             self.stack_store.deregister_stack_component(
                 component_type, name=name
@@ -920,10 +1109,26 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
                 name,
             )
 
+    def _get_metadata_store(self, stack_name: str) -> Any:
+        """Return the metadata store of the given stack, re-using a
+        previously materialized one where possible.
+
+        Args:
+            stack_name: Name of the stack whose metadata store to return.
+
+        Raises:
+            KeyError: If no stack with the given name exists.
+        """
+        metadata_store = self._metadata_store_cache.get(stack_name)
+        if metadata_store is None:
+            metadata_store = self.get_stack(stack_name).metadata_store
+            self._metadata_store_cache[stack_name] = metadata_store
+        return metadata_store
+
     @track(event=AnalyticsEvent.GET_PIPELINES)
     def get_pipelines(
         self, stack_name: Optional[str] = None
-    ) -> List[PipelineView]:
+    ) -> List["PipelineView"]:
         """Fetches post-execution pipeline views.
 
         Args:
@@ -945,13 +1150,13 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
                 "No active stack is configured for the repository. Run "
                 "`zenml stack set STACK_NAME` to update the active stack."
             )
-        metadata_store = self.get_stack(stack_name).metadata_store
+        metadata_store = self._get_metadata_store(stack_name)
         return metadata_store.get_pipelines()
 
     @track(event=AnalyticsEvent.GET_PIPELINE)
     def get_pipeline(
         self, pipeline_name: str, stack_name: Optional[str] = None
-    ) -> Optional[PipelineView]:
+    ) -> Optional["PipelineView"]:
         """Fetches a post-execution pipeline view.
 
         Args:
@@ -975,14 +1180,18 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
                 "No active stack is configured for the repository. Run "
                 "`zenml stack set STACK_NAME` to update the active stack."
             )
-        metadata_store = self.get_stack(stack_name).metadata_store
+        metadata_store = self._get_metadata_store(stack_name)
         return metadata_store.get_pipeline(pipeline_name)
 
     @staticmethod
     def is_repository_directory(path: Path) -> bool:
         """Checks whether a ZenML repository exists at the given path."""
-        config_dir = path / REPOSITORY_DIRECTORY_NAME
-        return fileio.isdir(str(config_dir))
+        # repositories always live on the local filesystem, so a single
+        # stat call suffices instead of a round-trip through the fileio
+        # filesystem abstraction
+        return os.path.isdir(
+            os.path.join(os.fspath(path), REPOSITORY_DIRECTORY_NAME)
+        )
 
     @staticmethod
     def find_repository(
@@ -1004,10 +1213,9 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             repository directory was found.
         """
         if not path:
-            # try to get path from the environment variable
-            env_var_path = os.getenv(ENV_ZENML_REPOSITORY_PATH)
-            if env_var_path:
-                path = Path(env_var_path)
+            # use the repository path from the environment variable, resolved
+            # once per process at module load (see `_refresh_env`)
+            path = _ENV_REPO_PATH
 
         if path:
             # explicit path via parameter or environment variable, don't search
@@ -1024,6 +1232,14 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             # working directory
             path = Path.cwd()
             search_parent_directories = True
+
+            # a previous search from the same directory is revalidated with
+            # a single stat call instead of walking the parents again
+            cached_root = _REPO_ROOT_CACHE.get(str(path))
+            if cached_root and Repository.is_repository_directory(
+                cached_root
+            ):
+                return cached_root
             warning_message = (
                 f"Unable to find ZenML repository in your current working "
                 f"directory ({path}) or any parent directories. If you "
@@ -1034,27 +1250,39 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
             )
 
         def _find_repo_helper(path_: Path) -> Optional[Path]:
-            """Helper function to recursively search parent directories for a
-            ZenML repository."""
-            if Repository.is_repository_directory(path_):
-                return path_
-
-            if not search_parent_directories or utils.is_root(str(path_)):
-                return None
-
-            return _find_repo_helper(path_.parent)
+            """Helper function to iteratively search parent directories for a
+            ZenML repository.
+
+            The search operates on raw path strings so that no intermediate
+            `Path` objects or Python stack frames are allocated per
+            directory level."""
+            current = str(path_)
+            while True:
+                if os.path.isdir(
+                    os.path.join(current, REPOSITORY_DIRECTORY_NAME)
+                ):
+                    return Path(current)
+
+                parent = os.path.dirname(current)
+                if not search_parent_directories or parent == current:
+                    # explicit path or filesystem root reached
+                    return None
+                current = parent
 
         repo_path = _find_repo_helper(path)
 
         if repo_path:
-            return repo_path.resolve()
+            repo_path = repo_path.resolve()
+            if search_parent_directories:
+                _REPO_ROOT_CACHE[str(path)] = repo_path
+            return repo_path
         if enable_warnings:
             logger.warning(warning_message)
         return None
 
     def _component_from_wrapper(
-        self, wrapper: StackComponentWrapper
-    ) -> StackComponent:
+        self, wrapper: "StackComponentWrapper"
+    ) -> "StackComponent":
         """Instantiate a StackComponent from the Configuration."""
         from zenml.stack.stack_component_class_registry import (
             StackComponentClassRegistry,
@@ -1068,8 +1296,10 @@ class Repository(BaseConfiguration, metaclass=RepositoryMetaClass):
         )
         return component_class.parse_obj(component_config)
 
-    def _stack_from_wrapper(self, wrapper: StackWrapper) -> Stack:
+    def _stack_from_wrapper(self, wrapper: "StackWrapper") -> "Stack":
         """Instantiate a Stack from the serializable Wrapper."""
+        from zenml.stack import Stack
+
         stack_components = {}
         for component_wrapper in wrapper.components:
             component_type = component_wrapper.type
@@ -12,16 +12,26 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import hashlib
+import json
+import logging
 import os
 import pathlib
+import signal
 import subprocess
 import sys
 import tempfile
 from abc import abstractmethod
 from typing import Dict, List, Optional, Tuple
 
-import psutil
 from pydantic import Field
+from pydantic.json import pydantic_encoder
+
+try:
+    # optional: considerably faster JSON encoding for the daemon config file
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from zenml.io.utils import create_dir_recursive_if_not_exists
 from zenml.logger import get_logger
@@ -71,6 +81,45 @@ class LocalDaemonServiceStatus(ServiceStatus):
     #   status)
     silent_daemon: bool = False
 
+    # digest of the service configuration last written to the config file,
+    # used to skip redundant serialization and disk writes
+    _last_config_digest: Optional[bytes] = None
+
+    # memoized runtime file paths, rebuilt whenever runtime_path changes
+    _paths_runtime_path: Optional[str] = None
+    _config_file: Optional[str] = None
+    _log_file: Optional[str] = None
+    _pid_file: Optional[str] = None
+
+    # last PID parsed from the PID file together with the file's stat
+    # signature; as long as the file is unchanged, accesses skip the
+    # open/read/parse and only re-check that the process still exists
+    _last_pid: Optional[int] = None
+    _last_pid_file_stat: Optional[Tuple[float, int]] = None
+
+    class Config:
+        """Pydantic configuration class."""
+
+        # all attributes with leading underscore are private and therefore
+        # are mutable and not included in serialization
+        underscore_attrs_are_private = True
+
+    def _compute_paths(self) -> None:
+        """(Re)build the memoized runtime file paths for the current value of
+        `runtime_path`."""
+        runtime_path = self.runtime_path
+        assert runtime_path is not None
+        self._config_file = os.path.join(
+            runtime_path, SERVICE_DAEMON_CONFIG_FILE_NAME
+        )
+        self._log_file = os.path.join(
+            runtime_path, SERVICE_DAEMON_LOG_FILE_NAME
+        )
+        self._pid_file = os.path.join(
+            runtime_path, SERVICE_DAEMON_PID_FILE_NAME
+        )
+        self._paths_runtime_path = runtime_path
+
     @property
     def config_file(self) -> Optional[str]:
         """Get the path to the configuration file used to start the service
@@ -82,7 +131,9 @@ class LocalDaemonServiceStatus(ServiceStatus):
         """
         if not self.runtime_path:
             return None
-        return os.path.join(self.runtime_path, SERVICE_DAEMON_CONFIG_FILE_NAME)
+        if self._paths_runtime_path != self.runtime_path:
+            self._compute_paths()
+        return self._config_file
 
     @property
     def log_file(self) -> Optional[str]:
@@ -95,7 +146,9 @@ class LocalDaemonServiceStatus(ServiceStatus):
         """
         if not self.runtime_path or self.silent_daemon:
             return None
-        return os.path.join(self.runtime_path, SERVICE_DAEMON_LOG_FILE_NAME)
+        if self._paths_runtime_path != self.runtime_path:
+            self._compute_paths()
+        return self._log_file
 
     @property
     def pid_file(self) -> Optional[str]:
@@ -108,7 +161,9 @@ class LocalDaemonServiceStatus(ServiceStatus):
         """
         if not self.runtime_path or self.silent_daemon:
             return None
-        return os.path.join(self.runtime_path, SERVICE_DAEMON_PID_FILE_NAME)
+        if self._paths_runtime_path != self.runtime_path:
+            self._compute_paths()
+        return self._pid_file
 
     @property
     def pid(self) -> Optional[int]:
@@ -122,9 +177,36 @@ class LocalDaemonServiceStatus(ServiceStatus):
             )
             return None
         else:
+            try:
+                file_stat = os.stat(pid_file)
+            except OSError:
+                # no PID file -> the daemon is not running
+                self._last_pid = None
+                self._last_pid_file_stat = None
+                return None
+
+            signature = (file_stat.st_mtime, file_stat.st_size)
+            if (
+                self._last_pid is not None
+                and self._last_pid_file_stat == signature
+            ):
+                # the PID file is unchanged since it was last parsed; only
+                # re-check that the process still exists. A PermissionError
+                # means the PID exists but belongs to another user, which
+                # counts as running (same as psutil.pid_exists).
+                try:
+                    os.kill(self._last_pid, 0)
+                except ProcessLookupError:
+                    return None
+                except OSError:
+                    pass
+                return self._last_pid
+
             from zenml.utils.daemon import get_daemon_pid_if_running
 
-            return get_daemon_pid_if_running(pid_file)
+            self._last_pid = get_daemon_pid_if_running(pid_file)
+            self._last_pid_file_stat = signature if self._last_pid else None
+            return self._last_pid
 
 
 class LocalDaemonService(BaseService):
@@ -206,7 +288,7 @@ class LocalDaemonService(BaseService):
         # the daemon is running
         return ServiceState.ACTIVE, ""
 
-    def _get_daemon_cmd(self) -> Tuple[List[str], Dict[str, str]]:
+    def _get_daemon_cmd(self) -> Tuple[List[str], Optional[Dict[str, str]]]:
         """Get the command to run the service daemon.
 
         The default implementation provided by this class is the following:
@@ -226,6 +308,8 @@ class LocalDaemonService(BaseService):
         Returns:
             Command needed to launch the daemon process and the environment
             variables to set, in the formats accepted by subprocess.Popen.
+            A None environment means the daemon process inherits the
+            environment of the current process unchanged.
         """
         # to avoid circular imports, import here
         import zenml.services.local.local_daemon_entrypoint as daemon_entrypoint
@@ -252,8 +336,24 @@ class LocalDaemonService(BaseService):
         assert self.status.config_file is not None
         assert self.status.pid_file is not None
 
-        with open(self.status.config_file, "w") as f:
-            f.write(self.json(indent=4))
+        # only rewrite the configuration file if the service configuration
+        # changed since it was last written
+        if orjson is not None:
+            payload = orjson.dumps(self.dict(), option=orjson.OPT_INDENT_2)
+        else:
+            # encode `dict()` directly instead of going through `json()`,
+            # which would build the same dict and then re-encode it with an
+            # extra intermediate string pass
+            payload = json.dumps(
+                self.dict(), indent=4, default=pydantic_encoder
+            ).encode()
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest != self.status._last_config_digest or not os.path.exists(
+            self.status.config_file
+        ):
+            with open(self.status.config_file, "wb") as f:
+                f.write(payload)
+            self.status._last_config_digest = digest
 
         # delete the previous PID file, in case a previous daemon process
         # crashed and left a stale PID file
@@ -270,12 +370,15 @@ class LocalDaemonService(BaseService):
             self.status.pid_file,
         ]
         if self.status.log_file:
-            pathlib.Path(self.status.log_file).touch()
+            # only create the log file if it doesn't exist yet; touching an
+            # existing file would add a redundant utime syscall
+            if not os.path.exists(self.status.log_file):
+                pathlib.Path(self.status.log_file).touch()
             command += ["--log-file", self.status.log_file]
 
-        command_env = os.environ.copy()
-
-        return command, command_env
+        # no environment overrides are needed, so let the daemon process
+        # inherit the parent environment directly instead of copying it
+        return command, None
 
     def _start_daemon(self) -> None:
         """Start the service daemon process associated with this service."""
@@ -296,13 +399,34 @@ class LocalDaemonService(BaseService):
             self.endpoint.prepare_for_start()
 
         command, command_env = self._get_daemon_cmd()
-        logger.debug(
-            "Running command to start daemon for service '%s': %s",
-            self,
-            " ".join(command),
-        )
-        p = subprocess.Popen(command, env=command_env)
-        p.wait()
+        # joining the command is only needed when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Running command to start daemon for service '%s': %s",
+                self,
+                " ".join(command),
+            )
+        if self.status.log_file:
+            with open(self.status.log_file, "a") as log_file:
+                subprocess.run(
+                    command,
+                    env=command_env,
+                    check=False,
+                    stdin=subprocess.DEVNULL,
+                    stdout=log_file,
+                    stderr=log_file,
+                    close_fds=True,
+                )
+        else:
+            subprocess.run(
+                command,
+                env=command_env,
+                check=False,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+            )
         pid = self.status.pid
         if pid:
             logger.debug(
@@ -334,16 +458,11 @@ class LocalDaemonService(BaseService):
 
         logger.debug("Stopping daemon for service '%s' ...", self)
         try:
-            p = psutil.Process(pid)
-        except psutil.Error:
+            os.kill(pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
             logger.error(
                 "Could not find process for for service '%s' ...", self
             )
-            return
-        if force:
-            p.kill()
-        else:
-            p.terminate()
 
     def provision(self) -> None:
         self._start_daemon()
@@ -11,22 +11,50 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
-from collections import defaultdict
-from typing import ClassVar, DefaultDict, Dict, Type, TypeVar
+import importlib
+import logging
+import sys
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
-from zenml.artifact_stores import LocalArtifactStore
-from zenml.container_registries import BaseContainerRegistry
 from zenml.enums import StackComponentType
 from zenml.logger import get_logger
-from zenml.metadata_stores import MySQLMetadataStore, SQLiteMetadataStore
-from zenml.orchestrators import LocalOrchestrator
-from zenml.secrets_managers.local.local_secrets_manager import (
-    LocalSecretsManager,
-)
 from zenml.stack import StackComponent
 
 logger = get_logger(__name__)
 
+# shared read-only sentinel for lookups of component types that have no
+# registered import path placeholders; popping from it is always a miss
+_EMPTY_CLASS_PATHS: Dict[str, str] = {}
+
+# flat (type, flavor) -> class mapping: a single hash lookup per resolution
+# and no accidental insertion of empty sub-dicts when an unknown type is
+# queried. Module-level so the lookup helpers reach it with a single global
+# load instead of a classmethod attribute chain. Once the integrations have
+# been activated the mapping is frozen into a read-only snapshot (see
+# `StackComponentClassRegistry.freeze`).
+_ComponentClassMap = Dict[
+    Tuple[StackComponentType, str], Type[StackComponent]
+]
+_REGISTRY: Mapping[
+    Tuple[StackComponentType, str], Type[StackComponent]
+] = {}
+
+C = TypeVar("C", bound=StackComponent)
+
 
 class StackComponentClassRegistry:
     """Registry for stack component classes.
@@ -36,33 +64,190 @@ class StackComponentClassRegistry:
     ZenML repository configuration.
     """
 
-    component_classes: ClassVar[
-        DefaultDict[StackComponentType, Dict[str, Type[StackComponent]]]
-    ] = defaultdict(dict)
+    __slots__ = ()
+
+    _frozen: ClassVar[bool] = False
+    _freeze_lock: ClassVar[threading.Lock] = threading.Lock()
+    # background thread warming up the registry by activating the
+    # integrations ahead of the first component class lookup (see `warm_up`)
+    _warmup_thread: ClassVar[Optional[threading.Thread]] = None
+    # exception that terminated the warm-up thread, if any; checked when the
+    # thread is joined so activation errors aren't silently swallowed
+    _warmup_error: ClassVar[Optional[BaseException]] = None
+    # import path placeholders (`module.ClassName`) for component classes
+    # that are registered without importing them; they are resolved to the
+    # actual class on first `get_class` lookup
+    component_class_paths: ClassVar[
+        Dict[StackComponentType, Dict[str, str]]
+    ] = {}
+    # (type, flavor) pairs known to be missing even after integration
+    # activation; repeated lookups fail fast instead of re-walking the
+    # activation path. Cleared whenever a new class or path is registered.
+    _missing: ClassVar[Set[Tuple[StackComponentType, str]]] = set()
+
+    def __new__(cls) -> "StackComponentClassRegistry":
+        """The registry is a namespace of classmethods over module-level
+        state and is not meant to be instantiated."""
+        raise TypeError(
+            f"{cls.__name__} is not instantiable; use its classmethods "
+            f"directly."
+        )
 
     @classmethod
-    def register_class(
+    def register_class_path(
         cls,
-        component_class: Type[StackComponent],
+        component_type: StackComponentType,
+        component_flavor: str,
+        component_class_path: str,
     ) -> None:
-        """Registers a stack component class."""
-        component_flavor = component_class.FLAVOR
-        flavors = cls.component_classes[component_class.TYPE]
-        if component_flavor in flavors:
+        """Registers the import path of a stack component class.
+
+        Unlike `register_class`, this only stores a cheap
+        `(type, flavor) -> import path` entry at registration time. The
+        module import and any validation that comes with it (e.g. building
+        the Pydantic schema of the component class) is deferred until
+        `get_class` first requests the flavor.
+
+        Args:
+            component_type: The type of the component class to register.
+            component_flavor: The flavor of the component class to register.
+            component_class_path: The full import path of the component
+                class, e.g. `zenml.orchestrators.LocalOrchestrator`.
+        """
+        cls.component_class_paths.setdefault(component_type, {})[
+            component_flavor
+        ] = component_class_path
+        # the new path may resolve a lookup that previously failed
+        cls._missing.discard((component_type, component_flavor))
+        logger.debug(
+            "Registered stack component class path '%s' for type '%s' and "
+            "flavor '%s'.",
+            component_class_path,
+            component_type.value,
+            component_flavor,
+        )
+
+    @classmethod
+    def register_class(
+        cls,
+        component_class: Type[C],
+    ) -> Type[C]:
+        """Registers a stack component class and returns it unmodified.
+
+        Returning the class allows this method to be used directly as a
+        class decorator (see `register_stack_component_class`)."""
+        component_type = component_class.TYPE
+        # interned flavor keys let dict lookups short-circuit on pointer
+        # equality instead of comparing characters
+        component_flavor = sys.intern(component_class.FLAVOR)
+        type_value = component_type.value
+        global _REGISTRY
+        key = (component_type, component_flavor)
+        if key in _REGISTRY:
             logger.warning(
                 "Overwriting previously registered stack component class `%s` "
                 "for type '%s' and flavor '%s'.",
-                flavors[component_flavor].__class__.__name__,
-                component_class.TYPE.value,
-                component_class.FLAVOR,
+                _REGISTRY[key].__name__,
+                type_value,
+                component_flavor,
             )
 
-        flavors[component_flavor] = component_class
-        logger.debug(
-            "Registered stack component class for type '%s' and flavor '%s'.",
-            component_class.TYPE.value,
-            component_flavor,
-        )
+        with cls._freeze_lock:
+            if cls._frozen:
+                # dynamic registration after the freeze is rare: thaw the
+                # snapshot, add the class and refreeze
+                classes = dict(_REGISTRY)
+                classes[key] = component_class
+                _REGISTRY = MappingProxyType(classes)
+            else:
+                cast(_ComponentClassMap, _REGISTRY)[key] = component_class
+        # a newly registered class may shadow or add a flavor, so cached
+        # lookups, negative lookups and error messages are no longer valid
+        cls._missing.clear()
+        _get_class_cached.cache_clear()
+        _missing_class_error_message.cache_clear()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Registered stack component class for type '%s' and flavor "
+                "'%s'.",
+                type_value,
+                component_flavor,
+            )
+        return component_class
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """Starts activating the integrations in a background thread.
+
+        Calling this ahead of the first component class lookup (e.g. when a
+        stack CLI command is dispatched) overlaps the integration import
+        chain with whatever else the caller is doing; `get_class` joins the
+        thread instead of activating the integrations on its own critical
+        path. Idempotent: subsequent calls are no-ops.
+        """
+        with cls._freeze_lock:
+            if cls._warmup_thread is not None:
+                return
+            from zenml.integrations.registry import integration_registry
+
+            def _activate() -> None:
+                try:
+                    integration_registry.activate_integrations()
+                except BaseException as e:
+                    # keep the error around for `_get_class_cached`: letting
+                    # it evaporate with the thread would turn a real
+                    # activation failure into a misleading "flavor not
+                    # found" lookup error
+                    cls._warmup_error = e
+
+            cls._warmup_thread = threading.Thread(
+                target=_activate,
+                name="zenml-integration-warmup",
+                daemon=True,
+            )
+            cls._warmup_thread.start()
+
+    @classmethod
+    def freeze(cls) -> None:
+        """Snapshots the registry into a read-only mapping.
+
+        After the integrations have been activated the flavor map is
+        effectively static for the lifetime of the process, so lookups can
+        run against an immutable snapshot. Late registrations are still
+        possible and transparently thaw and refreeze the snapshot.
+        """
+        global _REGISTRY
+        with cls._freeze_lock:
+            if not cls._frozen:
+                _REGISTRY = MappingProxyType(dict(_REGISTRY))
+                cls._frozen = True
+
+    @classmethod
+    def deregister_class(
+        cls,
+        component_type: StackComponentType,
+        component_flavor: str,
+    ) -> None:
+        """Removes a registered stack component class.
+
+        This method is mainly useful for tests that register temporary
+        component classes.
+
+        Args:
+            component_type: The type of the component class to remove.
+            component_flavor: The flavor of the component class to remove.
+        """
+        global _REGISTRY
+        key = (component_type, component_flavor)
+        with cls._freeze_lock:
+            if cls._frozen:
+                classes = dict(_REGISTRY)
+                classes.pop(key, None)
+                _REGISTRY = MappingProxyType(classes)
+            else:
+                cast(_ComponentClassMap, _REGISTRY).pop(key, None)
+        _get_class_cached.cache_clear()
+        _missing_class_error_message.cache_clear()
 
     @classmethod
     def get_class(
@@ -80,42 +265,189 @@ class StackComponentClassRegistry:
             KeyError: If no component class is registered for the given type
                 and flavor.
         """
+        if type(component_flavor) is str:
+            # flavors arriving from configs, CLI args or REST payloads are
+            # fresh str objects; interning them matches the interned keys
+            # stored at registration so dict probes compare by pointer
+            component_flavor = sys.intern(component_flavor)
+        return _get_class_cached(component_type, component_flavor)
 
-        available_flavors = cls.component_classes[component_type]
-        try:
-            return available_flavors[component_flavor]
-        except KeyError:
-            # The stack component might be part of an integration
-            # -> Activate the integrations and try again
-            from zenml.integrations.registry import integration_registry
 
-            integration_registry.activate_integrations()
+@lru_cache(maxsize=256)
+def _get_class_cached(
+    component_type: StackComponentType,
+    component_flavor: str,
+) -> Type[StackComponent]:
+    """Resolves a stack component class and memoizes the result.
 
-            try:
-                return available_flavors[component_flavor]
-            except KeyError:
-                raise KeyError(
-                    f"No stack component class found for type {component_type} "
-                    f"and flavor {component_flavor}. Registered flavors for "
-                    f"this type: {set(available_flavors)}. If your stack "
-                    f"component class is part of a ZenML integration, make "
-                    f"sure the corresponding integration is installed by "
-                    f"running `zenml integration install INTEGRATION_NAME`."
-                ) from None
+    Repeated stack hydration resolves the same (type, flavor) pairs over and
+    over; the LRU cache turns those lookups into a single C-level dict access
+    and avoids re-entering the integration activation path. The cache is
+    cleared whenever a new class is registered. Lookup failures raise and are
+    therefore never cached.
+    """
+    registry = StackComponentClassRegistry
+    key = (component_type, component_flavor)
+    try:
+        return _REGISTRY[key]
+    except KeyError:
+        pass
 
+    if key in registry._missing:
+        # the pair is known to be missing even after integration activation
+        # -> fail fast instead of re-walking the activation path
+        raise KeyError(
+            _missing_class_error_message(
+                component_type,
+                component_flavor,
+                _available_flavors(component_type),
+            )
+        ) from None
 
-C = TypeVar("C", bound=StackComponent)
+    # The class might only be registered as an import path placeholder
+    # -> import and register it now. Reading through `get` with a shared
+    # empty sentinel keeps the lookup free of insertion side effects for
+    # unknown component types.
+    class_path = registry.component_class_paths.get(
+        component_type, _EMPTY_CLASS_PATHS
+    ).get(component_flavor)
+    if class_path:
+        module_name, class_name = class_path.rsplit(".", maxsplit=1)
+        module = importlib.import_module(module_name)
+        component_class = cast(
+            Type[StackComponent], getattr(module, class_name)
+        )
+        if key not in _REGISTRY:
+            # importing the module usually registers the class through
+            # the `register_stack_component_class` decorator; only
+            # register explicitly if it didn't
+            registry.register_class(component_class)
+        # drop the placeholder only now that the class is registered; if
+        # the import above failed, the flavor stays registered by path and
+        # the next lookup surfaces the import error again instead of
+        # reporting the flavor as unknown
+        registry.component_class_paths[component_type].pop(
+            component_flavor, None
+        )
+        return _REGISTRY[key]
+
+    # The stack component might be part of an integration
+    # -> Activate the integrations and try again
+    warmup_thread = registry._warmup_thread
+    if warmup_thread is not None:
+        # a background warm-up was started earlier; wait for it to finish
+        # instead of re-entering the activation path
+        warmup_thread.join()
+    if warmup_thread is None or registry._warmup_error is not None:
+        # either no warm-up was started, or the warm-up thread died before
+        # activating all the integrations: activate them synchronously so a
+        # real activation error reaches the caller instead of being
+        # misreported (and negative-cached) as a missing flavor
+        from zenml.integrations.registry import integration_registry
+
+        integration_registry.activate_integrations()
+        registry._warmup_error = None
+
+    # all known sources of component classes have been exhausted, so the
+    # registry can be snapshotted into a read-only mapping
+    registry.freeze()
+
+    try:
+        return _REGISTRY[key]
+    except KeyError:
+        # the flavor is missing even after activation; remember that so
+        # repeated lookups don't re-trigger the activation walk
+        registry._missing.add(key)
+        raise KeyError(
+            _missing_class_error_message(
+                component_type,
+                component_flavor,
+                _available_flavors(component_type),
+            )
+        ) from None
+
+
+def _available_flavors(component_type: StackComponentType) -> FrozenSet[str]:
+    """Returns the registered flavors for the given component type.
+
+    Flavors still registered only as import path placeholders count as
+    available too; otherwise an error message could claim that no flavors
+    exist while the built-in ones simply haven't been resolved yet. Only
+    used to build lookup error messages, so the set construction cost is
+    irrelevant."""
+    placeholders = StackComponentClassRegistry.component_class_paths.get(
+        component_type, _EMPTY_CLASS_PATHS
+    )
+    return frozenset(
+        flavor for type_, flavor in _REGISTRY if type_ == component_type
+    ) | frozenset(placeholders)
+
+
+@lru_cache(maxsize=64)
+def _missing_class_error_message(
+    component_type: StackComponentType,
+    component_flavor: str,
+    available_flavors: FrozenSet[str],
+) -> str:
+    """Builds the error message for a failed component class lookup.
+
+    Memoized so that callers which swallow the error and retry in a loop
+    don't rebuild the same message each time; cleared together with the
+    lookup cache when a new class is registered.
+    """
+    return (
+        f"No stack component class found for type {component_type} "
+        f"and flavor {component_flavor}. Registered flavors for "
+        f"this type: {set(available_flavors)}. If your stack "
+        f"component class is part of a ZenML integration, make "
+        f"sure the corresponding integration is installed by "
+        f"running `zenml integration install INTEGRATION_NAME`."
+    )
 
 
-def register_stack_component_class(cls: Type[C]) -> Type[C]:
-    """Registers the stack component class and returns it unmodified."""
-    StackComponentClassRegistry.register_class(component_class=cls)
-    return cls
+# `register_class` returns the class it registers, so it can be used as a
+# class decorator directly; the alias avoids an extra wrapper frame per
+# decorated component class while keeping the public name stable
+register_stack_component_class = StackComponentClassRegistry.register_class
 
 
-StackComponentClassRegistry.register_class(LocalOrchestrator)
-StackComponentClassRegistry.register_class(SQLiteMetadataStore)
-StackComponentClassRegistry.register_class(MySQLMetadataStore)
-StackComponentClassRegistry.register_class(LocalArtifactStore)
-StackComponentClassRegistry.register_class(BaseContainerRegistry)
-StackComponentClassRegistry.register_class(LocalSecretsManager)
+# the built-in component classes are only registered by their import paths
+# here; importing them eagerly would pull in their full dependency chains
+# (e.g. SQLAlchemy for the metadata stores) on every `zenml.stack` import.
+# Looping over a tuple with the registration method bound once keeps the
+# module's import-time bytecode small.
+_register_path = StackComponentClassRegistry.register_class_path
+for _type, _flavor, _path in (
+    (
+        StackComponentType.ORCHESTRATOR,
+        "local",
+        "zenml.orchestrators.LocalOrchestrator",
+    ),
+    (
+        StackComponentType.METADATA_STORE,
+        "sqlite",
+        "zenml.metadata_stores.SQLiteMetadataStore",
+    ),
+    (
+        StackComponentType.METADATA_STORE,
+        "mysql",
+        "zenml.metadata_stores.MySQLMetadataStore",
+    ),
+    (
+        StackComponentType.ARTIFACT_STORE,
+        "local",
+        "zenml.artifact_stores.LocalArtifactStore",
+    ),
+    (
+        StackComponentType.CONTAINER_REGISTRY,
+        "default",
+        "zenml.container_registries.BaseContainerRegistry",
+    ),
+    (
+        StackComponentType.SECRETS_MANAGER,
+        "local",
+        "zenml.secrets_managers.LocalSecretsManager",
+    ),
+):
+    _register_path(_type, _flavor, _path)
+del _register_path, _type, _flavor, _path
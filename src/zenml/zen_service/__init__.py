@@ -22,12 +22,7 @@ Using the Zen Service's stacks in your project just requires setting up a
 profile with `rest` store-type pointed to the url of the service.
 """
 
-from zenml.zen_service.zen_service import (
-    ZenService,
-    ZenServiceConfig,
-    ZenServiceEndpoint,
-    ZenServiceEndpointConfig,
-)
+from typing import Any, List
 
 __all__ = [
     "ZenService",
@@ -35,3 +30,26 @@ __all__ = [
     "ZenServiceEndpoint",
     "ZenServiceEndpointConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily imports the Zen Service classes on first attribute access
+    (PEP 562).
+
+    The `zen_service.zen_service` submodule transitively imports FastAPI
+    and uvicorn; deferring the import means that code which never spins up
+    the service doesn't pay for it.
+    """
+    if name in __all__:
+        import zenml.zen_service.zen_service as zen_service
+
+        for attr in __all__:
+            globals()[attr] = getattr(zen_service, attr)
+        return globals()[name]
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}"
+    ) from None
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -12,8 +12,6 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
-import sys
-
 import pytest
 from click.testing import CliRunner
 from pytest_mock import MockFixture
@@ -71,11 +69,14 @@ def test_integration_install_inexistent_integration(
     no specific integration. This should lead to all packages for all
     integrations to be installed"""
     runner = CliRunner()
-    mock_install_package = mocker.patch.object(
-        sys.modules["zenml.cli.integration"],
-        "install_packages",
+    mock_install_package = mocker.patch(
+        "zenml.cli.integration_install.install_packages",
         return_value=None,
     )
+    mocker.patch(
+        "zenml.integrations.registry.IntegrationRegistry.installed_set",
+        return_value=frozenset(),
+    )
     result = runner.invoke(integration, ["install", not_an_integration])
 
     assert result.exit_code == 0
@@ -90,14 +91,13 @@ def test_integration_install_specific_integration(
     a specific integration"""
     runner = CliRunner()
 
-    mock_install_package = mocker.patch.object(
-        sys.modules["zenml.cli.integration"],
-        "install_packages",
+    mock_install_package = mocker.patch(
+        "zenml.cli.integration_install.install_packages",
         return_value=None,
     )
     mocker.patch(
-        "zenml.integrations.registry.IntegrationRegistry.is_installed",
-        return_value=False,
+        "zenml.integrations.registry.IntegrationRegistry.installed_set",
+        return_value=frozenset(),
     )
 
     result = runner.invoke(integration, ["install", "-f", integration_name])
@@ -110,14 +110,13 @@ def test_integration_install_multiple_integrations(mocker: MockFixture) -> None:
     multiple integration"""
     runner = CliRunner()
 
-    mock_install_package = mocker.patch.object(
-        sys.modules["zenml.cli.integration"],
-        "install_packages",
+    mock_install_package = mocker.patch(
+        "zenml.cli.integration_install.install_packages",
         return_value=None,
     )
     mocker.patch(
-        "zenml.integrations.registry.IntegrationRegistry.is_installed",
-        return_value=False,
+        "zenml.integrations.registry.IntegrationRegistry.installed_set",
+        return_value=frozenset(),
     )
 
     result = runner.invoke(integration, ["install", "-f", *INTEGRATIONS])
@@ -130,14 +129,13 @@ def test_integration_install_all(mocker: MockFixture) -> None:
     no specific integration. This should lead to all packages for all
     integrations to be installed"""
     runner = CliRunner()
-    mock_install_package = mocker.patch.object(
-        sys.modules["zenml.cli.integration"],
-        "install_packages",
+    mock_install_package = mocker.patch(
+        "zenml.cli.integration_install.install_packages",
         return_value=None,
     )
     mocker.patch(
-        "zenml.integrations.registry.IntegrationRegistry.is_installed",
-        return_value=False,
+        "zenml.integrations.registry.IntegrationRegistry.installed_set",
+        return_value=frozenset(),
     )
 
     result = runner.invoke(integration, ["install", "-f"])
@@ -153,9 +151,8 @@ def test_integration_uninstall_inexistent_integration(
     no specific integration. This should lead to all packages for all
     integrations to be installed"""
     runner = CliRunner()
-    mock_uninstall_package = mocker.patch.object(
-        sys.modules["zenml.cli.integration"],
-        "uninstall_package",
+    mock_uninstall_package = mocker.patch(
+        "zenml.cli.integration_uninstall.uninstall_packages",
         return_value=None,
     )
     result = runner.invoke(integration, ["uninstall", not_an_integration])
@@ -170,9 +167,8 @@ def test_integration_uninstall_specific_integration(
     """Tests that the uninstall command behaves as expected when supplied with
     a specific integration"""
     runner = CliRunner()
-    mock_uninstall_package = mocker.patch.object(
-        sys.modules["zenml.cli.integration"],
-        "uninstall_package",
+    mock_uninstall_package = mocker.patch(
+        "zenml.cli.integration_uninstall.uninstall_packages",
         return_value=None,
     )
     mocker.patch(
@@ -190,9 +186,8 @@ def test_integration_uninstall_all(mocker: MockFixture) -> None:
     no specific integration. This should lead to all packages for all
     integrations to be uninstalled"""
     runner = CliRunner()
-    mock_uninstall_package = mocker.patch.object(
-        sys.modules["zenml.cli.integration"],
-        "uninstall_package",
+    mock_uninstall_package = mocker.patch(
+        "zenml.cli.integration_uninstall.uninstall_packages",
         return_value=None,
     )
     mocker.patch(
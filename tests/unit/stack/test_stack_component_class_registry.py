@@ -27,6 +27,13 @@ from zenml.stack.stack_component_class_registry import (
 )
 
 
+def _deregister_component_class(stub_component):
+    """Removes a registered component class so other tests aren't affected."""
+    StackComponentClassRegistry.deregister_class(
+        stub_component.TYPE, stub_component.FLAVOR
+    )
+
+
 def test_stack_component_class_registry_has_local_classes_registered():
     """Tests that the local stack component classes are already registered
     when importing the StackComponentClassRegistry."""
@@ -80,10 +87,7 @@ def test_stack_component_class_registration(stub_component):
         )
 
     assert returned_class is type(stub_component)
-    # remove the registered component class so other tests aren't affected
-    StackComponentClassRegistry.component_classes[stub_component.TYPE].pop(
-        stub_component.FLAVOR
-    )
+    _deregister_component_class(stub_component)
 
 
 def test_stack_component_class_registration_decorator(stub_component):
@@ -97,10 +101,7 @@ def test_stack_component_class_registration_decorator(stub_component):
             component_flavor=stub_component.FLAVOR,
         )
 
-    # remove the registered component class so other tests aren't affected
-    StackComponentClassRegistry.component_classes[stub_component.TYPE].pop(
-        stub_component.FLAVOR
-    )
+    _deregister_component_class(stub_component)
 
 
 def test_stack_component_class_registry_activates_integrations_if_necessary(
@@ -135,7 +136,4 @@ def test_stack_component_class_registry_activates_integrations_if_necessary(
     assert stub_component_class is type(stub_component)
     integration_registry.activate_integrations.assert_called_once()
 
-    # remove the registered component class so other tests aren't affected
-    StackComponentClassRegistry.component_classes[stub_component.TYPE].pop(
-        stub_component.FLAVOR
-    )
+    _deregister_component_class(stub_component)
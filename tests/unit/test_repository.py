@@ -11,6 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+import json
 import os
 import random
 import string
@@ -30,8 +31,9 @@ from zenml.exceptions import (
 from zenml.io import fileio, utils
 from zenml.metadata_stores import MySQLMetadataStore, SQLiteMetadataStore
 from zenml.orchestrators import LocalOrchestrator
-from zenml.repository import Repository
+from zenml.repository import Repository, _refresh_env
 from zenml.stack import Stack
+from zenml.utils import yaml_utils
 
 
 def _create_local_stack(
@@ -126,11 +128,13 @@ def test_finding_repository_directory_with_explicit_path(tmp_path, clean_repo):
 
     # no repo exists and explicit path set via environment variable
     os.environ["ZENML_REPOSITORY_PATH"] = str(tmp_path)
+    _refresh_env()
     assert Repository.find_repository() is None
     Repository._reset_instance()
     assert Repository().root is None
 
     del os.environ["ZENML_REPOSITORY_PATH"]
+    _refresh_env()
 
     # initializing the repo
     Repository.initialize(tmp_path)
@@ -150,17 +154,20 @@ def test_finding_repository_directory_with_explicit_path(tmp_path, clean_repo):
 
     # repo exists and explicit path set via environment variable
     os.environ["ZENML_REPOSITORY_PATH"] = str(tmp_path)
+    _refresh_env()
     assert Repository.find_repository() == tmp_path
     Repository._reset_instance()
     assert Repository().root == tmp_path
 
     # repo exists and explicit path to subdirectory set via environment variable
     os.environ["ZENML_REPOSITORY_PATH"] = str(subdirectory_path)
+    _refresh_env()
     assert Repository.find_repository() is None
     Repository._reset_instance()
     assert Repository().root is None
 
     del os.environ["ZENML_REPOSITORY_PATH"]
+    _refresh_env()
 
 
 def test_repo_without_configuration_file_falls_back_to_empty_config(tmp_path):
@@ -174,6 +181,61 @@ def test_repo_without_configuration_file_falls_back_to_empty_config(tmp_path):
     assert repo.active_stack is not None
 
 
+def test_loading_config_prefers_a_fresh_json_sidecar(tmp_path, clean_repo):
+    """Tests that the repository configuration is loaded from the JSON
+    sidecar when the sidecar is at least as new as the YAML config."""
+    Repository.initialize(tmp_path)
+    repo = Repository(tmp_path)
+
+    stack = repo.active_stack
+    stack._name = "sidecar_stack"
+    repo.register_stack(stack)
+
+    yaml_path = tmp_path / ".zen" / "config.yaml"
+    json_path = tmp_path / ".zen" / "config.json"
+    assert json_path.exists()
+
+    # point the sidecar at the new stack while the YAML config still points
+    # at the old one
+    config_dict = json.loads(json_path.read_text())
+    config_dict["active_stack_name"] = "sidecar_stack"
+    json_path.write_text(json.dumps(config_dict))
+
+    # an equally old sidecar still counts as "at least as new"
+    yaml_stat = os.stat(str(yaml_path))
+    os.utime(str(json_path), (yaml_stat.st_atime, yaml_stat.st_mtime))
+
+    Repository.clear_caches()
+    assert Repository(tmp_path).active_stack_name == "sidecar_stack"
+
+
+def test_loading_config_ignores_a_stale_json_sidecar(tmp_path, clean_repo):
+    """Tests that a hand-edited YAML config that is newer than the JSON
+    sidecar takes precedence over the sidecar."""
+    Repository.initialize(tmp_path)
+    repo = Repository(tmp_path)
+
+    stack = repo.active_stack
+    stack._name = "yaml_stack"
+    repo.register_stack(stack)
+
+    yaml_path = tmp_path / ".zen" / "config.yaml"
+    json_path = tmp_path / ".zen" / "config.json"
+    assert json_path.exists()
+
+    # hand-edit the YAML config without updating the sidecar
+    config_dict = yaml_utils.read_yaml(str(yaml_path))
+    config_dict["active_stack_name"] = "yaml_stack"
+    yaml_utils.write_yaml(str(yaml_path), config_dict)
+
+    # make the hand-edited YAML config strictly newer than the sidecar
+    json_stat = os.stat(str(json_path))
+    os.utime(str(yaml_path), (json_stat.st_atime, json_stat.st_mtime + 10))
+
+    Repository.clear_caches()
+    assert Repository(tmp_path).active_stack_name == "yaml_stack"
+
+
 def test_creating_repository_instance_during_step_execution_fails(mocker):
     """Tests that creating a Repository instance while a step is being executed
     fails."""